@@ -191,8 +191,7 @@ class Giveaways(commands.Cog):
         if getattr(self.bot, "amari", None):
             asyncio.create_task(self.bot.amari.close())
             delattr(self.bot, "amari")
-        for i in Giveaway._tasks:
-            i.cancel()  # cancel all running tasks
+        Giveaway._cancel_scheduler()  # cancel the task starting scheduled giveaways
 
     @tasks.loop(minutes=5)
     async def save_giveaways(self):
@@ -372,9 +371,8 @@ class Giveaways(commands.Cog):
                 continue
             bucket = i.flags.message_cooldown.get_bucket(message)
             retry_after = bucket.update_rate_limit()
-            if not retry_after and getattr(i, "_message_cache", None):
-                i._message_cache.setdefault(message.author.id, 0)
-                i._message_cache[message.author.id] += 1
+            if not retry_after and getattr(i, "_message_cache", None) is not None:
+                i._bump_message_count(message.author.id)
 
     @commands.Cog.listener()
     async def on_command_completion(self, ctx: commands.Context):
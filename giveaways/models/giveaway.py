@@ -1,8 +1,15 @@
 import asyncio
 import contextlib
+import copy
+import heapq
+import itertools
+import logging
 import random
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, Coroutine, Counter, List, Optional
+from operator import itemgetter
+from typing import Any, Coroutine, Counter, Dict, FrozenSet, List, Optional, Tuple, Union
 
 import discord
 from redbot.core import commands
@@ -11,13 +18,53 @@ from redbot.core.bot import Red
 from ..exceptions import GiveawayAlreadyEnded, GiveawayError, GiveawayNotStarted
 from ..utils import Coordinate, SafeMember
 from .flags import GiveawayFlags
-from .guildsettings import apply_multi, get_guild_settings
+from .guildsettings import GuildSettings, apply_multi, get_guild_settings
 from .requirements import Requirements
 
+log = logging.getLogger("red.craycogs.giveaways.giveaway")
+
+_ALLOWED_MENTIONS_ROLES = discord.AllowedMentions(roles=True)
+
+# required giveaway kwargs mapped to the error raised when they are missing.
+_REQUIRED_KWARGS = {
+    "message_id": "No message ID provided.",
+    "guild_id": "No guild ID provided.",
+    "channel_id": "No channel ID provided.",
+    "ends_at": "No ends_at provided for the giveaway.",
+    "bot": "No bot object provided.",
+}
+_get_required_kwargs = itemgetter(*_REQUIRED_KWARGS)
+
+# bound locally since from_json runs for every stored giveaway when the cog loads.
+_dt_from_ts = datetime.fromtimestamp
+_utc = timezone.utc
+
 
 class GiveawayMeta:
 
-    _tasks = []
+    __slots__ = [
+        "bot",
+        "message_id",
+        "channel_id",
+        "guild_id",
+        "prize",
+        "requirements",
+        "flags",
+        "emoji",
+        "amount_of_winners",
+        "_entrants",
+        "_winners",
+        "_host",
+        "starts_at",
+        "ends_at",
+        "_starts_at_ts",
+        "_ends_at_ts",
+        "_settings_cache",
+        "_color",
+        "_json_cache",
+        "_req_dict",
+        "_amari_users",
+    ]
 
     def __init__(self, **kwargs):
         mid, gid, cid, e, bot = self.check_kwargs(kwargs)
@@ -37,6 +84,14 @@ class GiveawayMeta:
         self._host: int = kwargs.get("host")
         self.starts_at: datetime = kwargs.get("starts_at", datetime.now(tz=timezone.utc))
         self.ends_at: datetime = e
+        self._starts_at_ts: float = self.starts_at.timestamp()
+        self._ends_at_ts: float = self.ends_at.timestamp()
+
+        self._settings_cache: Optional[Tuple[float, GuildSettings]] = None
+        self._color: Optional[discord.Color] = None
+        self._json_cache: Optional[dict] = None  # reset to None whenever the giveaway changes
+        self._req_dict: Optional[dict] = None  # resolved requirements used by verify_entry
+        self._amari_users: Optional[Dict[int, dict]] = None  # set while picking winners
 
     @property
     def cog(self):
@@ -60,7 +115,9 @@ class GiveawayMeta:
 
     @property
     def winners(self) -> List[Optional[discord.Member]]:
-        return [self.guild.get_member(x) for x in self._winners]
+        guild = self.guild
+        members = {uid: guild.get_member(uid) for uid in set(self._winners)}
+        return [members[uid] for uid in self._winners]
 
     @property
     def entrants(self) -> List[Optional[discord.Member]]:
@@ -68,11 +125,11 @@ class GiveawayMeta:
 
     @property
     def started(self) -> bool:
-        return datetime.now(tz=timezone.utc) > self.starts_at
+        return time.time() > self._starts_at_ts
 
     @property
     def ended(self) -> bool:
-        return datetime.now(tz=timezone.utc) > self.ends_at
+        return time.time() > self._ends_at_ts
 
     @property
     def jump_url(self) -> str:
@@ -85,41 +142,40 @@ class GiveawayMeta:
     @property
     def json(self):
         """
-        Return json serializable giveaways metadata."""
-        return {
-            "message_id": self.message_id,
-            "channel_id": self.channel_id,
-            "guild_id": self.guild_id,
-            "prize": self.prize,
-            "amount_of_winners": self.amount_of_winners,
-            "requirements": self.requirements.json if self.requirements else {},
-            "flags": self.flags.json if self.flags else {},
-            "emoji": self.emoji,
-            "entrants": list(self._entrants),
-            "winners": self._winners,
-            "host": self._host,
-            "ends_at": self.ends_at.timestamp(),
-            "starts_at": self.starts_at.timestamp(),
-        }
+        Return json serializable giveaways metadata.
+
+        The dict is cached until the giveaway is modified, so don't mutate it."""
+        if self._json_cache is None:
+            self._json_cache = {
+                "message_id": self.message_id,
+                "channel_id": self.channel_id,
+                "guild_id": self.guild_id,
+                "prize": self.prize,
+                "amount_of_winners": self.amount_of_winners,
+                "requirements": self.requirements.json if self.requirements else {},
+                "flags": self.flags.json if self.flags else {},
+                "emoji": self.emoji,
+                "entrants": list(self._entrants),
+                "winners": self._winners,
+                "host": self._host,
+                "ends_at": self._ends_at_ts,
+                "starts_at": self._starts_at_ts,
+            }
+
+        return self._json_cache
 
     @staticmethod
     def check_kwargs(kwargs: dict):
-        if not (mid := kwargs.get("message_id")):
-            raise GiveawayError("No message ID provided.")
-
-        if not (gid := kwargs.get("guild_id")):
-            raise GiveawayError("No guild ID provided.")
-
-        if not (cid := kwargs.get("channel_id")):
-            raise GiveawayError("No channel ID provided.")
-
-        if not (e := kwargs.get("ends_at")):
-            raise GiveawayError("No ends_at provided for the giveaway.")
+        try:
+            values = _get_required_kwargs(kwargs)
+        except KeyError as e:
+            raise GiveawayError(_REQUIRED_KWARGS[e.args[0]]) from None
 
-        if not (bot := kwargs.get("bot")):
-            raise GiveawayError("No bot object provided.")
+        if not all(values):
+            key = next(key for key, value in zip(_REQUIRED_KWARGS, values) if not value)
+            raise GiveawayError(_REQUIRED_KWARGS[key])
 
-        return mid, gid, cid, e, bot
+        return values
 
     def __str__(self):
         return (
@@ -133,19 +189,29 @@ class GiveawayMeta:
         return self.__str__()
 
     def get_winners_str(self):
-        wcounter = Counter(self.winners)
-        w = "".join(f"<@{k.id}> x {v}, " 
-                    if v > 1
-                    else f"<@{k.id}> " 
-                    for k, v in wcounter.items())
+        wcounter = Counter(self._winners)
+        w = "".join(f"<@{uid}> x {v}, " if v > 1 else f"<@{uid}> " for uid, v in wcounter.items())
 
         if not wcounter:
             w += "There were no winners. "
 
         return w
 
+    async def _settings(self) -> GuildSettings:
+        """
+        Return the guild settings, re-fetched only if the cached copy is over 5 seconds old."""
+        if self._settings_cache and time.time() - self._settings_cache[0] < 5:
+            return self._settings_cache[1]
+
+        settings = await get_guild_settings(self.guild_id)
+        self._settings_cache = (time.time(), settings)
+        return settings
+
     async def get_embed_color(self):
-        set_color = (await get_guild_settings(self.guild.id)).color
+        if self._color is not None:
+            return self._color
+
+        set_color = (await self._settings()).color
         channel = self.channel or await self.bot.fetch_channel(self.channel_id)
 
         if not channel:
@@ -153,17 +219,89 @@ class GiveawayMeta:
 
         bot_color = await self.bot.get_embed_color(channel)
 
-        return discord.Color(set_color) if set_color else bot_color
+        self._color = discord.Color(set_color) if set_color else bot_color
+        return self._color
+
+    def _get_req_dict(self) -> Dict[str, Union[FrozenSet[int], int]]:
+        """
+        Return the set requirements with role id lists turned into sets.
+
+        Cached till the requirements are changed. Roles are resolved only when reporting them."""
+        if self._req_dict is None:
+            self._req_dict = {
+                key: frozenset(map(int, value)) if isinstance(value, list) else value
+                for key, value in self.requirements.as_dict().items()
+                if value
+            }
+
+        return self._req_dict
+
+    async def _get_amari_user(self, member: discord.Member, suppress_errors: bool = False):
+        """
+        Fetch the member's amari data, reusing it if winners are being picked."""
+        if self._amari_users is not None and member.id in self._amari_users:
+            return self._amari_users[member.id]
+
+        user = {}
+        if suppress_errors:
+            with contextlib.suppress(Exception):
+                user = await self.bot.amari.get_user(member.guild.id, member.id) or {}
+        else:
+            user = await self.bot.amari.get_user(member.guild.id, member.id) or {}
+
+        if self._amari_users is not None:
+            self._amari_users[member.id] = user
+
+        return user
+
+    def _check_amari_level(self, member: discord.Member, value: int, user: dict):
+        level = user.get("level", 0)
+        if int(level) < int(value):
+            return False, (
+                f"Your entry for [this]({self.jump_url}) giveaway has been removed.\n"
+                f"You are amari level `{level}` which is `{value - level}` levels fewer than the required `{value}`."
+            )
+
+        return True, ""
+
+    def _check_amari_weekly(self, member: discord.Member, value: int, user: dict):
+        weeklyxp = user.get("weeklyExp", 0)
+        if int(weeklyxp) < int(value):
+            return False, (
+                f"Your entry for [this]({self.jump_url}) giveaway has been removed.\n"
+                f"You have `{weeklyxp}` weekly amari xp which is `{value - weeklyxp}` "
+                f"xp fewer than the required `{value}`."
+            )
+
+        return True, ""
+
+    def _check_messages(self, member: discord.Member, value: int, user: dict):
+        messages = self._message_cache.get(member.id, 0)
+        if not messages >= value:
+            return False, (
+                f"Your entry for [this]({self.jump_url}) giveaway has been removed.\n"
+                f"You have sent `{messages}` messages since the giveaway started "
+                f"which is `{value - messages}` messages fewer than the required `{value}`."
+            )
+
+        return True, ""
+
+    _requirement_checks = {
+        "amari_level": _check_amari_level,
+        "amari_weekly": _check_amari_weekly,
+        "messages": _check_messages,
+    }
 
     async def _get_message(self) -> Optional[discord.Message]:
-        msg = list(filter(lambda x: x.id == self.message_id, self.bot.cached_messages))
+        msg = next((m for m in self.bot.cached_messages if m.id == self.message_id), None)
+        if msg:
+            return msg
+
         channel = self.channel or await self.bot.fetch_channel(self.channel_id)
 
         if not channel:
             raise GiveawayError("The channel for this giveaway could not be found.")
 
-        if msg:
-            return msg[0]
         try:
             msg = await channel.fetch_message(self.message_id)
         except Exception:
@@ -173,27 +311,37 @@ class GiveawayMeta:
     @classmethod
     def from_json(cls, json: dict):
         mid, gid, cid, e, bot = cls.check_kwargs(json)
+        get = json.get
         return cls(
-            **{
-                "message_id": mid,
-                "channel_id": cid,
-                "guild_id": gid,
-                "bot": bot,
-                "prize": json.get("prize", "Giveaway prize"),
-                "amount_of_winners": json.get("amount_of_winners", 1),
-                "requirements": Requirements.from_json(json.get("requirements", {})),
-                "flags": GiveawayFlags.from_json(json.get("flags", {}), bot.get_guild(gid)),
-                "emoji": json.get("emoji", ":tada:"),
-                "entrants": json.get("entrants", []),
-                "winners": json.get("winners", []),
-                "host": json.get("host"),
-                "ends_at": datetime.fromtimestamp(e, tz=timezone.utc),
-                "starts_at": datetime.fromtimestamp(json.get("starts_at"), tz=timezone.utc),
-            }
+            message_id=mid,
+            channel_id=cid,
+            guild_id=gid,
+            bot=bot,
+            prize=get("prize", "Giveaway prize"),
+            amount_of_winners=get("amount_of_winners", 1),
+            requirements=Requirements.from_json(get("requirements", {})),
+            flags=GiveawayFlags.from_json(get("flags", {}), bot.get_guild(gid)),
+            emoji=get("emoji", ":tada:"),
+            entrants=get("entrants", []),
+            winners=get("winners", []),
+            host=get("host"),
+            ends_at=_dt_from_ts(e, tz=_utc),
+            starts_at=_dt_from_ts(get("starts_at"), tz=_utc),
         )
 
 
 class Giveaway(GiveawayMeta):
+
+    __slots__ = ["_message_cache"]
+
+    # heap of (starts_at timestamp, tiebreaker, giveaway) for giveaways yet to start.
+    _pending: List[Tuple[float, int, "Giveaway"]] = []
+    _counter = itertools.count()
+    _scheduler_task: Optional[asyncio.Task] = None
+    _next_wake: Optional[float] = None  # only set while the scheduler is sleeping
+
+    _message_cache_size = 100_000  # max amount of members whose messages are counted
+
     def __init__(
         self,
         *,
@@ -230,23 +378,61 @@ class Giveaway(GiveawayMeta):
             amount_of_winners=amount_of_winners,
         )
 
-        if self.starts_at > datetime.now(timezone.utc):
-            self._tasks.append(self.bot.loop.create_task(self._wait_until_start()))
+        if not self.started:
+            self._schedule(self)
 
         if self.flags.message_count or self.requirements.messages:
-            self._message_cache = {}
+            self._message_cache: "OrderedDict[int, int]" = OrderedDict()
 
-    async def _wait_until_start(self):
-        while True:
-            if self.starts_at > datetime.now(timezone.utc):
-                await asyncio.sleep(15)
-                continue
+    def _bump_message_count(self, user_id: int):
+        cache = self._message_cache
+        cache[user_id] = cache.get(user_id, 0) + 1
+        cache.move_to_end(user_id)
 
-            await self.start()
-            break
+        while len(cache) > self._message_cache_size:
+            cache.popitem(last=False)  # evict the least recently active member
 
-    async def hdm(self):
-        settings = await get_guild_settings(self.guild_id)
+    @classmethod
+    def _schedule(cls, giveaway: "Giveaway"):
+        starts_at = giveaway._starts_at_ts
+        heapq.heappush(cls._pending, (starts_at, next(cls._counter), giveaway))
+
+        task = cls._scheduler_task
+        if task is None or task.done():
+            cls._scheduler_task = giveaway.bot.loop.create_task(cls._scheduler())
+
+        elif cls._next_wake is not None and starts_at < cls._next_wake:
+            # the scheduler is sleeping till a later giveaway, wake it up for this one.
+            task.cancel()
+            cls._scheduler_task = giveaway.bot.loop.create_task(cls._scheduler())
+
+    @classmethod
+    def _cancel_scheduler(cls):
+        if cls._scheduler_task is not None:
+            cls._scheduler_task.cancel()
+
+        cls._scheduler_task = None
+        cls._next_wake = None
+        cls._pending.clear()
+
+    @classmethod
+    async def _scheduler(cls):
+        while cls._pending:
+            starts_at = cls._pending[0][0]
+            cls._next_wake = starts_at
+            await asyncio.sleep(max(0, starts_at - time.time()))
+            cls._next_wake = None
+
+            *_, giveaway = heapq.heappop(cls._pending)
+            try:
+                await giveaway.start()
+
+            except Exception as e:
+                log.exception(f"Error occurred while starting giveaway {giveaway}: ", exc_info=e)
+
+    async def hdm(self, settings: GuildSettings = None):
+        settings = settings or await self._settings()
+        guild = self.guild
 
         winners = self.get_winners_str()
 
@@ -255,7 +441,7 @@ class Giveaway(GiveawayMeta):
                 prize=self.prize,
                 winners=winners,
                 winners_amount=self.amount_of_winners,
-                server=self.guild.name,
+                server=guild.name,
                 jump_url=self.jump_url,
             )
         )
@@ -266,15 +452,14 @@ class Giveaway(GiveawayMeta):
                     title="Your giveaway has ended!",
                     description=hostdm_message,
                     color=await self.get_embed_color(),
-                )
-                embed.set_thumbnail(url=self.guild.icon_url)
+                ).set_thumbnail(url=guild.icon_url)
                 await host.send(embed=embed)
 
             except discord.HTTPException:
                 return False
 
-    async def wdm(self):
-        settings = await get_guild_settings(self.guild_id)
+    async def wdm(self, settings: GuildSettings = None):
+        settings = settings or await self._settings()
 
         winners = self.get_winners_str()
 
@@ -288,48 +473,55 @@ class Giveaway(GiveawayMeta):
             )
         )
 
-        winners = Counter(self.winners)
-        for winner in winners.keys():
-            if winner:
-                try:
-                    embed = discord.Embed(
-                        title="Congratulations!",
-                        description=winnerdm_message,
-                        color=await self.get_embed_color(),
-                    ).set_thumbnail(url=self.guild.icon_url)
-                    await winner.send(embed=embed)
+        guild = self.guild
+        embed = discord.Embed(
+            title="Congratulations!",
+            description=winnerdm_message,
+            color=await self.get_embed_color(),
+        ).set_thumbnail(url=guild.icon_url)
+
+        results = await asyncio.gather(
+            *(
+                winner.send(embed=embed)
+                for uid in set(self._winners)
+                if (winner := guild.get_member(uid))
+            ),
+            return_exceptions=True,
+        )
 
-                except discord.HTTPException:
-                    return False
+        for result in results:
+            if isinstance(result, Exception) and not isinstance(result, discord.HTTPException):
+                raise result
+
+        if any(isinstance(result, discord.HTTPException) for result in results):
+            return False
 
     async def create_embed(self) -> discord.Embed:
-        settings = await get_guild_settings(self.guild.id)
+        settings = await self._settings()
+        guild = self.guild
+        host = self.host
+        ends_at = int(self._ends_at_ts)
 
-        timestamp_str = (
-            f"<t:{int(self.ends_at.timestamp())}:R> (<t:{int(self.ends_at.timestamp())}:f>)"
-        )
+        timestamp_str = f"<t:{ends_at}:R> (<t:{ends_at}:f>)"
         embed_title = settings.embed_title.format_map(Coordinate(prize=self.prize))
         embed_description = settings.embed_description.format_map(
             Coordinate(
                 prize=self.prize,
                 emoji=self.emoji,
                 timestamp=timestamp_str,
-                raw_timestamp=int(self.ends_at.timestamp()),
-                server=self.guild.name,
-                host=SafeMember(self.host),
-                donor=SafeMember(self.flags.donor or self.host),
+                raw_timestamp=ends_at,
+                server=guild.name,
+                host=SafeMember(host),
+                donor=SafeMember(self.flags.donor or host),
                 winners=self.amount_of_winners,
             )
         )
         embed_footer_text = settings.embed_footer_text.format_map(
-            Coordinate(server=self.guild.name, winners=self.amount_of_winners)
-        )
-        embed_footer_icon = settings.embed_footer_icon.format_map(
-            Coordinate(server_icon_url=self.guild.icon_url, host_avatar_url=self.host.avatar_url)
-        )
-        embed_thumbnail = settings.embed_thumbnail.format_map(
-            Coordinate(server_icon_url=self.guild.icon_url, host_avatar_url=self.host.avatar_url)
+            Coordinate(server=guild.name, winners=self.amount_of_winners)
         )
+        icons = Coordinate(server_icon_url=guild.icon_url, host_avatar_url=host.avatar_url)
+        embed_footer_icon = settings.embed_footer_icon.format_map(icons)
+        embed_thumbnail = settings.embed_thumbnail.format_map(icons)
 
         embed = (
             discord.Embed(
@@ -346,16 +538,15 @@ class Giveaway(GiveawayMeta):
         if self.flags.donor:
             embed.add_field(name="**Donor:**", value=f"{self.flags.donor.mention}", inline=False)
 
-        if self.flags.no_defaults:
-            requirements = self.requirements.no_defaults(True)  # ignore defaults.
-
-        if not self.flags.no_defaults:
-            requirements = self.requirements.no_defaults()  # defaults will be used!!!
+        # defaults are ignored with the --no-defaults flag, otherwise they will be used!!!
+        requirements = self.requirements.no_defaults(bool(self.flags.no_defaults))
 
         if self.flags.message_count != 0:
             requirements.messages = self.flags.message_count
 
         self.requirements = requirements
+        self._json_cache = None
+        self._req_dict = None
 
         req_str = await requirements.get_str(self.guild_id)
         if not requirements.null and req_str != "":
@@ -371,70 +562,59 @@ class Giveaway(GiveawayMeta):
                 "restricts you from joining your own giveaway."
             )
 
-        if not self.requirements.null:
-            requirements = self.requirements.as_role_dict(member.guild)
-
-            if requirements["bypass"]:
-                maybe_bypass = any(role in member.roles for role in requirements["bypass"])
-                if maybe_bypass:
-                    return True, ""
-                    # All the below requirements can be overlooked if user has bypass role.
-
-            for key, value in requirements.items():
-                if value:
-                    if isinstance(value, list):
-                        for i in value:
-                            if key == "blacklist" and i in member.roles:
-                                return False, (
-                                    f"Your entry for [this]({self.jump_url}) giveaway has been removed.\n"
-                                    "You had a role that was blacklisted from this giveaway.\n"
-                                    f"Blacklisted role: `{i.name}`"
-                                )
-
-                            elif key == "required" and i not in member.roles:
-                                return False, (
-                                    f"Your entry for [this]({self.jump_url}) giveaway has been removed.\n"
-                                    "You did not have the required role to join it.\n"
-                                    f"Required role: `{i.name}`"
-                                )
-
-                    else:
-                        user = {}
-                        if key == "amari_level":
-                            try:
-                                user = (
-                                    await self.bot.amari.get_user(member.guild.id, member.id) or {}
-                                )
-                            except:
-                                raise
-                            level = user.get("level", 0)
-                            if int(level) < int(value):
-                                return False, (
-                                    f"Your entry for [this]({self.jump_url}) giveaway has been removed.\n"
-                                    f"You are amari level `{level}` which is `{value - level}` levels fewer than the required `{value}`."
-                                )
-
-                        elif key == "amari_weekly":
-                            with contextlib.suppress(Exception):
-                                user = (
-                                    await self.bot.amari.get_user(member.guild.id, member.id) or {}
-                                )
-                            weeklyxp = user.get("weeklyExp", 0)
-                            if int(weeklyxp) < int(value):
-                                return False, (
-                                    f"Your entry for [this]({self.jump_url}) giveaway has been removed.\n"
-                                    f"You have `{weeklyxp}` weekly amari xp which is `{value - weeklyxp}` "
-                                    f"xp fewer than the required `{value}`."
-                                )
-
-                        elif key == "messages":
-                            messages = self._message_cache.setdefault(member.id, 0)
-                            if not messages >= value:
-                                return False, (
-                                    f"Your entry for [this]({self.jump_url}) giveaway has been removed.\n"
-                                    f"You have sent `{messages}` messages since the giveaway started "
-                                    f"which is `{value - messages}` messages fewer than the required `{value}`."
-                                )
+        if requirements := self._get_req_dict():
+            guild = member.guild
+            member_roles = {role.id for role in member.roles}
+
+            if requirements.get("bypass", frozenset()) & member_roles:
+                return True, ""
+                # All the below requirements can be overlooked if user has bypass role.
+
+            if missing := requirements.get("required", frozenset()) - member_roles:
+                # report the first configured role that still exists, deleted roles are skipped.
+                role = next(
+                    (
+                        role
+                        for i in self.requirements.required
+                        if int(i) in missing and (role := guild.get_role(int(i)))
+                    ),
+                    None,
+                )
+                if role:
+                    return False, (
+                        f"Your entry for [this]({self.jump_url}) giveaway has been removed.\n"
+                        "You did not have the required role to join it.\n"
+                        f"Required role: `{role.name}`"
+                    )
+
+            if blacklisted := requirements.get("blacklist", frozenset()) & member_roles:
+                role = next(
+                    (
+                        role
+                        for i in self.requirements.blacklist
+                        if int(i) in blacklisted and (role := guild.get_role(int(i)))
+                    ),
+                    None,
+                )
+                if role:
+                    return False, (
+                        f"Your entry for [this]({self.jump_url}) giveaway has been removed.\n"
+                        "You had a role that was blacklisted from this giveaway.\n"
+                        f"Blacklisted role: `{role.name}`"
+                    )
+
+            user = {}
+            if "amari_level" in requirements or "amari_weekly" in requirements:
+                # one request serves both, errors are only raised for the level requirement.
+                user = await self._get_amari_user(
+                    member, suppress_errors="amari_level" not in requirements
+                )
+
+            for key, check in self._requirement_checks.items():
+                if value := requirements.get(key):
+                    result = check(self, member, value, user)
+                    if not result[0]:
+                        return result
 
         return True, ""
 
@@ -443,10 +623,11 @@ class Giveaway(GiveawayMeta):
         if not result:
             return statement
 
-        if member.id in self.entrants:
+        if member.id in self._entrants:
             return False
 
         self._entrants.add(member.id)
+        self._json_cache = None
         return True
 
     async def remove_entrant(self, member: discord.Member):
@@ -454,19 +635,21 @@ class Giveaway(GiveawayMeta):
             return False
 
         self._entrants.remove(member.id)
+        self._json_cache = None
         return True
 
-    async def _handle_flags(self):
+    async def _handle_flags(self, settings: GuildSettings = None):
         flags = self.flags
 
         if flags.channel:
             self.channel_id = flags.channel.id
+            self._json_cache = None
 
         ping = flags.ping
         msg = flags.message
         thank = flags.thank
 
-        settings = await get_guild_settings(self.guild_id)
+        settings = settings or await self._settings()
         channel = self.channel or await self.bot.fetch_channel(self.channel_id)
 
         if not channel:
@@ -480,19 +663,16 @@ class Giveaway(GiveawayMeta):
                 else "No pingrole set. Use the `gset pingrole` command to add a pingrole."
             )
 
-        kwargs = {"content": None, "embed": None}
+        color = await self.get_embed_color()
 
-        if ping:
-            kwargs["content"] = ping
+        content = ping or None
+        embed = discord.Embed(description=f"***Message***: {msg}", color=color) if msg else None
 
-        if msg:
-            kwargs["embed"] = discord.Embed(
-                description=f"***Message***: {msg}", color=await self.get_embed_color()
+        if content or embed:
+            await channel.send(
+                content=content, embed=embed, allowed_mentions=_ALLOWED_MENTIONS_ROLES
             )
 
-        if any((kwargs["content"], kwargs["embed"])):
-            await channel.send(**kwargs, allowed_mentions=discord.AllowedMentions(roles=True))
-
         if thank:
             tmsg = settings.tmsg
             embed = discord.Embed(
@@ -502,24 +682,43 @@ class Giveaway(GiveawayMeta):
                         prize=self.prize,
                     )
                 ),
-                color=await self.get_embed_color(),
+                color=color,
             )
             await channel.send(embed=embed)
 
     async def pick_winners(self, entrants: List[discord.Member] = None):
         w_list = []
-        entrants = entrants or self.entrants
-
-        if entrants:
-            for _ in range(self.amount_of_winners):
-                w = random.choice(entrants)
-                if not (await self.verify_entry(w))[0]:
+        if entrants is None:
+            entrants = [m for m in self.entrants if m]
+        amount = self.amount_of_winners
+        no_multiple_winners = self.flags.no_multiple_winners
+
+        if not entrants:
+            return w_list
+
+        if no_multiple_winners:
+            # oversample so entrants failing the requirements can be skipped.
+            candidates = random.sample(entrants, min(len(entrants), amount * 3))
+        else:
+            candidates = random.choices(entrants, k=amount)
+
+        picked = set()  # entrants can be repeated by multipliers
+        self._amari_users = {}
+        try:
+            for w in candidates:
+                if len(w_list) == amount:
+                    break
+                if no_multiple_winners and w.id in picked:
                     continue
-                if self.flags.no_multiple_winners and w in w_list:
+                if not (await self.verify_entry(w))[0]:
                     continue
 
+                picked.add(w.id)
                 w_list.append(w)
 
+        finally:
+            self._amari_users = None
+
         return w_list
 
     async def start(self):
@@ -534,7 +733,7 @@ class Giveaway(GiveawayMeta):
 
         embed = await self.create_embed()
 
-        settings = await get_guild_settings(self.guild_id)
+        settings = await self._settings()
 
         channel = self.channel or await self.bot.fetch_channel(self.channel_id)
 
@@ -545,9 +744,19 @@ class Giveaway(GiveawayMeta):
         await gmsg.add_reaction(self.emoji)
 
         self.message_id = gmsg.id
+        self._json_cache = None
         self.cog.add_to_cache(self)
 
-        await self._handle_flags()
+        await self._handle_flags(settings)
+
+    async def _gather_end_tasks(self, tasks: List[Coroutine]):
+        """
+        Run the independent message edits and DMs of ending a giveaway concurrently.
+
+        Errors are logged so one failed request doesn't stop the giveaway from ending."""
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, Exception):
+                log.exception(f"Error occurred while ending giveaway {self}: ", exc_info=result)
 
     async def end(self, reason=None) -> "EndedGiveaway":
         if not self.started:
@@ -570,7 +779,7 @@ class Giveaway(GiveawayMeta):
                 "The giveaway message was either deleted or bot had no `read message/history` permissions.",
             )
         guild = self.guild
-        settings = await get_guild_settings(guild.id)
+        settings = await self._settings()
         winners = self.amount_of_winners
         embed = msg.embeds[0]
         prize = self.prize
@@ -579,8 +788,9 @@ class Giveaway(GiveawayMeta):
         hostdm = settings.hostdm
         endmsg: str = settings.endmsg
         gmsg = msg
-        entrants = self.entrants
-        random.shuffle(entrants)
+        entrant_ids = list(self._entrants)
+        random.shuffle(entrant_ids)
+        entrants = [m for m in map(guild.get_member, entrant_ids) if m]
         if not self.flags.no_multi:
             entrants = await apply_multi(guild, entrants)
         link = self.jump_url
@@ -588,6 +798,7 @@ class Giveaway(GiveawayMeta):
         w_list = await self.pick_winners(entrants)
 
         self._winners = [i.id for i in w_list]
+        self._json_cache = None
 
         w = self.get_winners_str()
 
@@ -602,32 +813,35 @@ class Giveaway(GiveawayMeta):
                 f"This giveaway has ended.\nThere were 0 winners.\n**Host:** {host.mention}"
             )
             embed.set_footer(text=f"{guild.name} - Winners: {winners}", icon_url=guild.icon_url)
-            await gmsg.edit(embed=embed)
 
-            await gmsg.reply(endmsg.format_map(formatdict))
+            tasks = [gmsg.edit(embed=embed), gmsg.reply(endmsg.format_map(formatdict))]
             if hostdm == True:
-                await self.hdm()
+                tasks.append(self.hdm(settings))
 
+            await self._gather_end_tasks(tasks)
             return EndedGiveaway.from_giveaway(self, reason)
 
         embed: discord.Embed = gmsg.embeds[0]
         embed.color = discord.Color.red()
         embed.description = f"This giveaway has ended.\n**Winners:** {w}\n**Host:** {host.mention}"
         embed.set_footer(text=f"{guild.name} - Winners: {winners}", icon_url=guild.icon_url)
-        await gmsg.edit(embed=embed)
 
-        await gmsg.reply(endmsg.format_map(formatdict))
+        tasks = [gmsg.edit(embed=embed), gmsg.reply(endmsg.format_map(formatdict))]
 
         if winnerdm == True:
-            await self.wdm()
+            tasks.append(self.wdm(settings))
 
         if hostdm == True:
-            await self.hdm()
+            tasks.append(self.hdm(settings))
 
+        await self._gather_end_tasks(tasks)
         return EndedGiveaway.from_giveaway(self, reason)
 
 
 class EndedGiveaway(GiveawayMeta):
+
+    __slots__ = ["reason"]
+
     def __init__(
         self,
         *,
@@ -673,9 +887,7 @@ class EndedGiveaway(GiveawayMeta):
 
     @property
     def json(self):
-        json = super().json
-        json.update(reason=self.reason)
-        return json
+        return {**super().json, "reason": self.reason}
 
     async def reroll(self, ctx: commands.Context, winners: int = None):
         gmsg = await self.message
@@ -683,8 +895,9 @@ class EndedGiveaway(GiveawayMeta):
             await ctx.send("I couldn't find the giveaway message.")
             return
         winners = winners or 1
-        entrants = self.entrants
-        entrants = await apply_multi(self.guild, entrants)
+        guild = self.guild
+        entrants = [m for m in map(guild.get_member, self._entrants) if m]
+        entrants = await apply_multi(guild, entrants)
         link = self.jump_url
 
         if len(entrants) == 0:
@@ -694,15 +907,23 @@ class EndedGiveaway(GiveawayMeta):
             return
 
         winner = []
-        for _ in self.entrants:
-            w = random.choice(entrants)
-            if not (await Giveaway.verify_entry(self, w))[0]:
-                entrants.remove(w)
-                continue
-            winner.append(w.id)
-            if len(winner) == winners:
-                break
+        failed = set()  # entrants can be repeated by multipliers
+        self._amari_users = {}
+        try:
+            for w in random.sample(entrants, min(len(entrants), len(self._entrants))):
+                if w.id in failed:
+                    continue
+                if not (await Giveaway.verify_entry(self, w))[0]:
+                    failed.add(w.id)
+                    continue
+                winner.append(w.id)
+                if len(winner) == winners:
+                    break
+
+        finally:
+            self._amari_users = None
         self._winners = winner
+        self._json_cache = None
 
         w = self.get_winners_str()
 
@@ -721,7 +942,7 @@ class EndedGiveaway(GiveawayMeta):
     @classmethod
     def from_giveaway(cls, giveaway: Giveaway, reason=None):
         reason = reason or "Giveaway ended successfully."
-        kwargs = giveaway.json
+        kwargs = copy.deepcopy(giveaway.json)  # from_json mutates the nested dicts
         kwargs.update(reason=reason, bot=giveaway.bot)
         return cls.from_json(kwargs)
 